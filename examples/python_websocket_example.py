@@ -1,5 +1,4 @@
 import threading
-import time
 
 from ObscuraProto import (
     Client,
@@ -16,8 +15,8 @@ OP_SERVER_RESPONSE = 0x2002
 
 # --- Synchronization Events ---
 client_ready_event = threading.Event()
-server_received_event = threading.Event()
-client_received_event = threading.Event()
+# The response is only sent from the server handler, so receiving it marks the whole exchange as done.
+exchange_done_event = threading.Event()
 
 
 def main():
@@ -41,11 +40,7 @@ def main():
         response = PayloadBuilder(OP_SERVER_RESPONSE).add_param("Hello from server!").build()
         server.send_anonymous(hdl, response)
 
-        server_received_event.set()
-
     server.start(port)
-    # Give the server a moment to start up
-    time.sleep(0.1)
 
     # 3. Setup and Start Client
     client = Client(server.public_key)
@@ -64,7 +59,7 @@ def main():
     def handle_server_response(response: str):
         print("\n--- Client Received Response ---")
         print(f"[CLIENT] Received: response='{response}'")
-        client_received_event.set()
+        exchange_done_event.set()
 
     client.connect(f"ws://localhost:{port}")
 
@@ -83,10 +78,7 @@ def main():
 
     # 6. Wait for the full exchange to complete
     print("[SYSTEM] Waiting for message exchange to complete...")
-    server_received = server_received_event.wait(timeout=5)
-    client_received = client_received_event.wait(timeout=5)
-
-    if server_received and client_received:
+    if exchange_done_event.wait(timeout=5):
         print("\n[SYSTEM] Communication successful.")
     else:
         print("\n[SYSTEM] Communication failed or timed out.")
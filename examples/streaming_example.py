@@ -33,7 +33,6 @@ def handle_stream(stream: op.Stream):
 
 
 server.start(9006)
-time.sleep(0.1)
 
 # ---- Client ----
 client = op.Client(server.public_key)
@@ -3,16 +3,30 @@ ObscuraProto high-level Python library.
 """
 
 import asyncio  # Added for asyncio integration
+import bisect
 import inspect
+import logging
+import types
 
 try:
     # This is the C++ extension module built by CMake.
     from . import _obscuraproto as _bindings
-except ImportError:
-    # If the extension is not in the same directory, it might be in the build/lib directory.
-    # This is a fallback for development environments. For a real installation,
-    # the package structure would handle this.
+except ImportError as import_error:
     import os
+
+    # Installed packages always ship the extension next to this file. Searching
+    # the build/ directory of a source checkout is a development-only fallback,
+    # so regular imports never touch the filesystem beyond the package itself.
+    if not os.environ.get("OBSCURAPROTO_DEV"):
+        raise ImportError(
+            "Could not import the compiled ObscuraProto C++ bindings (_obscuraproto). "
+            "Please make sure the project is built, or set OBSCURAPROTO_DEV=1 to load "
+            "them from the build/ directory of a source checkout. "
+            f"Original error: {import_error}"
+        ) from import_error
+
+    import glob
+    import importlib.util
     import sys
 
     # Heuristic to find the build directory.
@@ -20,33 +34,77 @@ except ImportError:
     proj_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
     build_dir = os.path.join(proj_root, "build")
 
-    # The compiled library is directly in the build directory now
-    if os.path.isdir(build_dir):
-        sys.path.insert(0, build_dir)
-
-    try:
-        # The module name includes version and platform info, so we search for it.
-        if os.path.isdir(build_dir):
-            for f in os.listdir(build_dir):
-                if f.startswith("_obscuraproto") and f.endswith(".so"):
-                    import importlib.util
-
-                    spec = importlib.util.spec_from_file_location("_obscuraproto", os.path.join(build_dir, f))
-                    _bindings = importlib.util.module_from_spec(spec)  # pyright: ignore[reportArgumentType]
-                    spec.loader.exec_module(_bindings)  # pyright: ignore[reportOptionalMemberAccess]
-                    sys.modules["_obscuraproto"] = _bindings
-                    break
-            else:
-                raise ImportError("Could not find the _obscuraproto.*.so module in the build directory.")
-        else:
-            raise ImportError("Build directory not found.")
-
-    except ImportError as e:
+    # The module name includes version and platform info, so we search for it.
+    # A missing build directory simply yields no candidates.
+    candidates = glob.glob(os.path.join(build_dir, "_obscuraproto*.so"))
+    if not candidates:
         raise ImportError(
             "Could not import the compiled ObscuraProto C++ bindings (_obscuraproto). "
-            "Please make sure the project is built. "
-            f"Original error: {e}"
-        )
+            f"Please make sure the project is built: no _obscuraproto.*.so module found in {build_dir}."
+        ) from import_error
+
+    spec = importlib.util.spec_from_file_location("_obscuraproto", candidates[0])
+    _bindings = importlib.util.module_from_spec(spec)  # pyright: ignore[reportArgumentType]
+    spec.loader.exec_module(_bindings)  # pyright: ignore[reportOptionalMemberAccess]
+    sys.modules["_obscuraproto"] = _bindings
+    sys.modules[f"{__name__}._obscuraproto"] = _bindings
+
+
+# --- Re-export low-level components ---
+from ._obscuraproto import (
+    SUPPORTED_VERSIONS,
+    V1_0,
+    Config,
+    ConnectionHdl,
+    ConnectionLimitConfig,
+    CppStream,
+    Crypto,
+    KeyPair,
+    MessageLimitConfig,
+    Payload,
+    PayloadBuilder,
+    PayloadReader,
+    PrivateKey,
+    PublicKey,
+    RateLimitConfig,
+    ReservedOpcodes,
+    Role,
+    TimeoutConfig,
+)
+from ._obscuraproto import WsClient as _WsClient
+from ._obscuraproto import WsServer as _WsServer
+
+__all__ = [
+    "Server",
+    "Client",
+    "Stream",
+    "uint",
+    "Role",
+    "Crypto",
+    "Payload",
+    "PayloadBuilder",
+    "PayloadReader",
+    "KeyPair",
+    "PublicKey",
+    "PrivateKey",
+    "V1_0",
+    "SUPPORTED_VERSIONS",
+    "ConnectionHdl",
+    "CppStream",
+    "Config",
+    "RateLimitConfig",
+    "ConnectionLimitConfig",
+    "MessageLimitConfig",
+    "TimeoutConfig",
+    "ReservedOpcodes",
+]
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Native entry points used by Server and Client, bound once at import.
+_generate_sign_keypair = Crypto.generate_sign_keypair
+_default_config = Config.with_defaults
 
 
 # --- Marker type for automatic unpacking ---
@@ -64,27 +122,11 @@ class uint(int):
     pass
 
 
-# --- Re-export low-level components ---
-Role = _bindings.Role
-Crypto = _bindings.Crypto
-Payload = _bindings.Payload
-PayloadBuilder = _bindings.PayloadBuilder
-PayloadReader = _bindings.PayloadReader
-KeyPair = _bindings.KeyPair
-PublicKey = _bindings.PublicKey
-PrivateKey = _bindings.PrivateKey
-V1_0 = _bindings.V1_0
-SUPPORTED_VERSIONS = _bindings.SUPPORTED_VERSIONS
-ConnectionHdl = _bindings.ConnectionHdl
-CppStream = _bindings.CppStream
-
-# Config
-Config = _bindings.Config
-RateLimitConfig = _bindings.RateLimitConfig
-ConnectionLimitConfig = _bindings.ConnectionLimitConfig
-MessageLimitConfig = _bindings.MessageLimitConfig
-TimeoutConfig = _bindings.TimeoutConfig
-ReservedOpcodes = _bindings.ReservedOpcodes
+# Type hints supported by auto-unpacking, mapped to an index into _FORMAT_CODES.
+_ANNO_TO_IDX = {str: 0, int: 1, uint: 2, float: 3, bool: 4, bytes: 5}
+
+# Payload.unpack format codes for each supported type, in index order.
+_FORMAT_CODES = "siufby"
 
 
 class Stream:
@@ -144,11 +186,7 @@ class Stream:
             def on_chunk(data: bytes):
                 print(f"Got {len(data)} bytes")
         """
-
-        def wrapper(data_list):
-            handler(bytes(data_list))
-
-        self._s.set_data_handler(wrapper)
+        self._s.set_data_handler(handler)
         return handler
 
     def on_end(self, handler):
@@ -176,89 +214,150 @@ class Stream:
         return handler
 
 
+# Annotation recorded for parameters without a type hint.
+_EMPTY = inspect.Parameter.empty
+
+# Code flags of functions whose real parameters ``__code__`` does not list.
+_VARIADIC_FLAGS = inspect.CO_VARARGS | inspect.CO_VARKEYWORDS
+
+# ``*args``/``**kwargs`` never receive an unpacked value, so they are not reported.
+_VARIADIC_KINDS = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+
+
+def _handler_params(handler):
+    """
+    Returns ``(name, annotation)`` for each positional parameter of ``handler``.
+
+    Plain functions and bound methods are read straight from ``__code__`` and
+    ``__annotations__``. Other callables, decorated handlers (which expose
+    ``__wrapped__``) and functions taking ``*args``/``**kwargs`` or keyword-only
+    parameters fall back to ``inspect.signature``, which follows ``__wrapped__``
+    to the real signature.
+
+    Handlers are always called positionally, so keyword-only parameters raise
+    ``TypeError`` here rather than when the first payload arrives.
+    """
+    code = getattr(handler, "__code__", None)
+    if code is None or hasattr(handler, "__wrapped__") or code.co_flags & _VARIADIC_FLAGS or code.co_kwonlyargcount:
+        params = []
+        for param in inspect.signature(handler).parameters.values():
+            if param.kind is inspect.Parameter.KEYWORD_ONLY:
+                raise TypeError(
+                    f"Handler '{handler.__name__}' has keyword-only parameter '{param.name}'; "
+                    "handler parameters are passed positionally."
+                )
+            if param.kind not in _VARIADIC_KINDS:
+                params.append((param.name, param.annotation))
+        return params
+
+    names = code.co_varnames[: code.co_argcount]
+    if getattr(handler, "__self__", None) is not None:
+        names = names[1:]
+    annotations = handler.__annotations__
+    return [(name, annotations.get(name, _EMPTY)) for name in names]
+
+
+def _unpack_index(handler, param):
+    """Returns the ``_ANNO_TO_IDX`` index used to unpack the ``(name, annotation)`` pair ``param``."""
+    name, annotation = param
+    try:
+        return _ANNO_TO_IDX[annotation]
+    except (KeyError, TypeError):
+        raise TypeError(
+            f"Handler '{handler.__name__}' has an unsupported or missing type hint for parameter '{name}'."
+        ) from None
+
+
+# Compiled unpacking wrapper function code, keyed by its call shape.
+_WRAPPER_CODE_CACHE = {}
+
+
+def _compile_unpacking_wrapper(receives_hdl_from_native, passes_hdl, passes_payload, fmt):
+    """
+    Returns the function code of ``unpacking_wrapper`` for a call shape.
+
+    The generated wrapper is straight-line code: a single ``Payload.unpack``
+    call that reads every parameter natively, and a direct call to the
+    handler, e.g. for a server handler ``(hdl: ConnectionHdl, name: str, value: uint)``::
+
+        def unpacking_wrapper(hdl, p, h=handler):
+            return h(hdl, *p.unpack("su"))
+
+    A payload that does not match the signature makes ``unpack`` raise; the
+    exception propagates to the native dispatcher, which reports it.
+
+    The source is compiled once per call shape; each handler then only binds
+    the cached code to itself as the ``h`` default.
+    """
+    key = (receives_hdl_from_native, passes_hdl, passes_payload, fmt)
+    code = _WRAPPER_CODE_CACHE.get(key)
+    if code is not None:
+        return code
+
+    params = "hdl, p" if receives_hdl_from_native else "p"
+    if passes_payload:
+        call_args = ["p"]
+    elif fmt:
+        call_args = [f"*p.unpack({fmt!r})"]
+    else:
+        call_args = []
+    if passes_hdl:
+        call_args.insert(0, "hdl")
+
+    namespace = {}
+    source = f"def unpacking_wrapper({params}, h=None):\n    return h({', '.join(call_args)})"
+    exec(compile(source, "<unpacking_wrapper>", "exec"), namespace)
+    code = _WRAPPER_CODE_CACHE[key] = namespace["unpacking_wrapper"].__code__
+    return code
+
+
 def _create_unpacking_handler(handler, receives_hdl_from_native=False):
     """
     Internal helper to create a wrapper function that intelligently calls a handler
     by inspecting its type hints. It can pass the connection handle, the raw payload,
     or auto-unpacked arguments.
+
+    The handler signature is resolved once, at registration time, so that
+    unsupported type hints fail fast and dispatching a payload does no
+    per-call signature work.
     """
-    sig = inspect.signature(handler)
-    params = sig.parameters
+    params = _handler_params(handler)
+    annotations = [annotation for _, annotation in params]
 
-    hdl_param = None
-    payload_param = None
-    unpack_params = []
+    # Handlers without any type hints receive exactly what C++ passes.
+    if annotations and all(annotation is _EMPTY for annotation in annotations):
+        return handler
 
-    for param in params.values():
-        if param.annotation is ConnectionHdl:
-            hdl_param = param
-        elif param.annotation is Payload:
-            payload_param = param
-        elif param.annotation is not param.empty:
-            unpack_params.append(param)
+    passes_hdl = bool(annotations) and annotations[0] is ConnectionHdl
+    unpack_params = params[1:] if passes_hdl else params
+    unpack_annotations = annotations[1:] if passes_hdl else annotations
 
     # --- Basic validation ---
-    if hdl_param and not receives_hdl_from_native:
+    if passes_hdl and not receives_hdl_from_native:
         raise TypeError(
             f"Handler '{handler.__name__}' is annotated with ConnectionHdl "
             "but is registered on a client, which does not receive it."
         )
-    if payload_param and unpack_params:
+    if ConnectionHdl in unpack_annotations:
+        raise TypeError(f"Handler '{handler.__name__}' must take its ConnectionHdl parameter first.")
+
+    passes_payload = Payload in unpack_annotations
+    if passes_payload and len(unpack_params) > 1:
         raise TypeError(
             f"Handler '{handler.__name__}' cannot mix auto-unpacking "
             "parameters and a 'Payload' parameter. Choose one method."
         )
 
-    # --- Create the specialized wrapper ---
-    def unpacking_wrapper(*args):
-        # Determine what C++ passed us based on the context
-        hdl = args[0] if receives_hdl_from_native else None
-        payload = args[1] if receives_hdl_from_native else args[0]
-
-        handler_kwargs = {}
-
-        if hdl_param:
-            handler_kwargs[hdl_param.name] = hdl
-
-        if payload_param:
-            handler_kwargs[payload_param.name] = payload
-            # When using raw payload, no further unpacking is done.
-            return handler(**handler_kwargs)
-
-        # If there are params to unpack, do it.
-        if unpack_params:
-            reader = PayloadReader(payload)
-            type_map = {
-                str: reader.read_string,
-                int: reader.read_int,
-                uint: reader.read_uint,
-                float: reader.read_float,
-                bool: reader.read_bool,
-                bytes: reader.read_bytes,
-            }
-
-            try:
-                for param in unpack_params:
-                    type_hint = param.annotation
-                    if type_hint in type_map:
-                        handler_kwargs[param.name] = type_map[type_hint]()
-                    else:
-                        # This case covers missing or unsupported type hints for unpacking
-                        raise TypeError(f"Unsupported or missing type hint for parameter '{param.name}'.")
-
-            except Exception as e:
-                op_code_hex = f"0x{payload.op_code:04x}" if payload else "N/A"
-                print(
-                    f"[ERROR] Failed to auto-unpack payload for OpCode {op_code_hex}. "
-                    f"Check handler '{handler.__name__}' signature "
-                    f"matches the payload structure. Details: {e}"
-                )
-                return  # Suppress further errors
+    # A raw-payload handler that takes exactly what C++ passes needs no wrapper.
+    if passes_payload and passes_hdl == receives_hdl_from_native:
+        return handler
 
-        # Call the handler with the arguments we've prepared.
-        # This works even if there are no unpack_params (fire-and-forget handlers).
-        return handler(**handler_kwargs)
+    fmt = "" if passes_payload else "".join(_FORMAT_CODES[_unpack_index(handler, param)] for param in unpack_params)
 
+    # --- Create the specialized wrapper ---
+    code = _compile_unpacking_wrapper(receives_hdl_from_native, passes_hdl, passes_payload, fmt)
+    unpacking_wrapper = types.FunctionType(code, globals(), "unpacking_wrapper", (handler,))
+    unpacking_wrapper.__wrapped__ = handler
     return unpacking_wrapper
 
 
@@ -268,74 +367,61 @@ def _create_request_unpacking_handler(handler, receives_hdl_from_native=False):
     It intelligently calls a handler by inspecting its type hints, passing the
     connection handle (for server), or auto-unpacked arguments from a PayloadReader.
     The handler is expected to return a Payload object.
-    """
-    sig = inspect.signature(handler)
-    params = sig.parameters
 
-    hdl_param = None
-    unpack_params = []
+    The signature is resolved at registration time to a format string, so a
+    request reads every parameter with a single ``PayloadReader.read_params``
+    call. Handlers that also take the ``PayloadReader`` itself are unpacked one
+    ``read_*`` call at a time, in parameter order.
+    """
+    param_list = _handler_params(handler)
 
     # Identify hdl parameter if present
-    param_list = list(params.values())
-    if receives_hdl_from_native and param_list and param_list[0].annotation is ConnectionHdl:
-        hdl_param = param_list[0]
-        unpack_params = param_list[1:]
+    passes_hdl = receives_hdl_from_native and bool(param_list) and param_list[0][1] is ConnectionHdl
+    unpack_params = param_list[1:] if passes_hdl else param_list
+    if any(annotation is ConnectionHdl for _, annotation in unpack_params):
+        raise TypeError(f"Handler '{handler.__name__}' must take its ConnectionHdl parameter first.")
+
+    if any(annotation is PayloadReader for _, annotation in unpack_params):
+        # -1 passes the PayloadReader itself, for handlers that explicitly request it.
+        fmt = None
+        indices = tuple(-1 if param[1] is PayloadReader else _unpack_index(handler, param) for param in unpack_params)
     else:
-        unpack_params = param_list
+        fmt = "".join(_FORMAT_CODES[_unpack_index(handler, param)] for param in unpack_params)
+        indices = ()
 
     def unpacking_request_wrapper(*args):
-        # Determine what C++ passed us based on the context
-        # For server: (hdl, reader_obj)
-        # For client: (reader_obj)
-        if receives_hdl_from_native:
-            hdl = args[0]
-            reader_obj = args[1]
-        else:
-            hdl = None
-            reader_obj = args[0]  # This will be the PayloadReader object passed from C++
-
-        handler_kwargs = {}
-        if hdl_param:
-            handler_kwargs[hdl_param.name] = hdl
-
-        # Unpack parameters from the PayloadReader
-        reader = reader_obj  # In C++, PayloadReader is passed by reference, Python gets a binding object
-
-        type_map = {
-            str: reader.read_string,
-            int: reader.read_int,
-            uint: reader.read_uint,
-            float: reader.read_float,
-            bool: reader.read_bool,
-            bytes: reader.read_bytes,
-        }
+        # C++ passes (hdl, reader) on the server and (reader) on the client.
+        # In C++, PayloadReader is passed by reference, Python gets a binding object.
+        reader = args[-1]
 
         try:
-            for param in unpack_params:
-                type_hint = param.annotation
-                if type_hint is PayloadReader:  # If the handler explicitly requests PayloadReader
-                    handler_kwargs[param.name] = reader
-                elif type_hint in type_map:
-                    handler_kwargs[param.name] = type_map[type_hint]()
-                else:
-                    raise TypeError(f"Unsupported or missing type hint for parameter '{param.name}'.")
+            if fmt is not None:
+                unpacked = reader.read_params(fmt)
+            else:
+                methods = (
+                    reader.read_string,
+                    reader.read_int,
+                    reader.read_uint,
+                    reader.read_float,
+                    reader.read_bool,
+                    reader.read_bytes,
+                )
+                unpacked = [reader if i < 0 else methods[i]() for i in indices]
 
         except Exception as e:
-            # We don't have opcode easily here, as it's extracted by C++ before passing PayloadReader
-            print(
-                f"[ERROR] Failed to auto-unpack request payload for handler '{handler.__name__}'. "
-                f"Check that the handler signature matches the expected payload structure. Details: {e}"
+            # Unlike payload handlers, errors are not left to the native dispatcher:
+            # it drops the request without replying, so the requester would wait
+            # forever. Answer with an error payload instead.
+            logger.exception(
+                "Failed to auto-unpack request payload for handler '%s'. "
+                "Check that the handler signature matches the expected payload structure.",
+                handler.__name__,
             )
-            # For request handlers, if unpacking fails, we must return an error payload
-            # or allow the C++ layer to handle the exception. For now, a generic error.
-            # A more robust solution might involve an error payload specific opcode.
-            # The C++ will handle the Python exception, but returning a Payload is cleaner.
-            error_payload = PayloadBuilder(0x0000).add_param(f"Error: {e}").build()
-            return error_payload
+            return PayloadBuilder(0x0000).add_param(f"Error: {e}").build()
 
         # Call the handler, expecting a Payload return
-        response_payload = handler(**handler_kwargs)
-        if not isinstance(response_payload, _bindings.Payload):
+        response_payload = handler(args[0], *unpacked) if passes_hdl else handler(*unpacked)
+        if not isinstance(response_payload, Payload):
             raise TypeError(
                 f"Request handler '{handler.__name__}' must return a "
                 f"'Payload' object, but returned {type(response_payload)}"
@@ -345,6 +431,64 @@ def _create_request_unpacking_handler(handler, receives_hdl_from_native=False):
     return unpacking_request_wrapper
 
 
+class _OpcodeRanges:
+    """
+    Payload handlers for inclusive opcode ranges, dispatched from the native
+    default payload handler.
+
+    Ranges may not overlap and are looked up with a binary search over their
+    first opcodes. The fallback is the user's default payload handler, which
+    receives opcodes that no range covers.
+    """
+
+    def __init__(self):
+        self._firsts = []
+        self._entries = []  # (last, handler), parallel to _firsts
+        self._fallback = None
+
+    def __bool__(self):
+        return bool(self._entries)
+
+    def add(self, first, last, handler):
+        if first > last:
+            raise ValueError(f"Opcode range 0x{first:04x}-0x{last:04x} is empty.")
+        i = bisect.bisect_left(self._firsts, first)
+        if (i > 0 and self._entries[i - 1][0] >= first) or (i < len(self._firsts) and self._firsts[i] <= last):
+            raise ValueError(f"Opcode range 0x{first:04x}-0x{last:04x} overlaps an existing range.")
+        self._firsts.insert(i, first)
+        self._entries.insert(i, (last, handler))
+
+    def set_fallback(self, handler):
+        self._fallback = handler
+
+    def find(self, op_code):
+        """Returns the handler for ``op_code``, or the fallback if no range covers it."""
+        i = bisect.bisect_right(self._firsts, op_code) - 1
+        if i >= 0:
+            last, handler = self._entries[i]
+            if op_code <= last:
+                return handler
+        return self._fallback
+
+    def native_handler(self, receives_hdl_from_native):
+        """Returns the callable to install as the native default payload handler."""
+        if not self:
+            return self._fallback
+        find = self.find
+
+        def dispatch_with_hdl(hdl, payload):
+            handler = find(payload.op_code)
+            if handler is not None:
+                handler(hdl, payload)
+
+        def dispatch(payload):
+            handler = find(payload.op_code)
+            if handler is not None:
+                handler(payload)
+
+        return dispatch_with_hdl if receives_hdl_from_native else dispatch
+
+
 # --- High-level wrapper classes ---
 
 
@@ -362,9 +506,11 @@ class Server:
         Args:
             config: An optional Config object. If None, default config is used.
         """
-        self._long_term_key = _bindings.Crypto.generate_sign_keypair()
-        cfg = config if config is not None else _bindings.Config.with_defaults()
-        self._server = _bindings.WsServer(self._long_term_key, cfg)
+        self._long_term_key = _generate_sign_keypair()
+        cfg = config if config is not None else _default_config()
+        self._server = _WsServer(self._long_term_key, cfg)
+        self._payload_ranges = _OpcodeRanges()
+        self._anon_payload_ranges = _OpcodeRanges()
 
     @property
     def public_key(self):
@@ -375,21 +521,28 @@ class Server:
         """
         Starts the WebSocket server on the given port.
         This runs the server in a background thread.
+
+        The listening socket is bound before this returns, so clients can
+        connect immediately without waiting for the server to come up.
         """
-        print(f"[PY-SERVER] Starting on port {port}...")
+        logger.info("Server starting on port %s...", port)
         self._server.run(port)
-        print("[PY-SERVER] Started.")
+        logger.info("Server started.")
 
     def stop(self):
         """Stops the server."""
-        print("[PY-SERVER] Stopping...")
+        logger.info("Server stopping...")
         self._server.stop()
-        print("[PY-SERVER] Stopped.")
+        logger.info("Server stopped.")
 
     def send(self, hdl, payload):
         """Sends a payload to a specific client."""
         self._server.send(hdl, payload)
 
+    def send_many(self, hdl, payloads):
+        """Sends a sequence of payloads to a specific client in a single native call."""
+        self._server.send_many(hdl, list(payloads))
+
     async def async_request(self, hdl, payload) -> Payload:
         """Sends a request to a specific client and returns a future for the response."""
         return await asyncio.to_thread(self._server.sync_request, hdl, payload)
@@ -437,9 +590,12 @@ class Server:
         payload based on type hints. If no type hints are provided, it will be
         called with `(hdl, payload)`.
 
+        Arguments are passed positionally: a ``ConnectionHdl`` parameter, if
+        any, must come first, and keyword-only parameters are rejected.
+
         Example:
             @server.on_payload(0x1001)
-            def handle_login(hdl, username: str, password: str, attempt: uint):
+            def handle_login(hdl: ConnectionHdl, username: str, password: str, attempt: uint):
                 print(f"Login attempt for '{username}'")
         """
 
@@ -450,12 +606,34 @@ class Server:
 
         return decorator
 
+    def on_payload_range(self, first, last):
+        """
+        Decorator to register a handler for every opcode from ``first`` to ``last``
+        (inclusive) that has no handler of its own.
+
+        Arguments are unpacked the same way as for :meth:`on_payload`; take a
+        ``Payload`` to see which opcode arrived.
+
+        Example:
+            @server.on_payload_range(0x5000, 0x5FFF)
+            def handle_telemetry(hdl: ConnectionHdl, payload: Payload):
+                print(f"Telemetry 0x{payload.op_code:04x}")
+        """
+
+        def decorator(handler):
+            wrapper = _create_unpacking_handler(handler, receives_hdl_from_native=True)
+            self._payload_ranges.add(first, last, wrapper)
+            self._server.set_default_payload_handler(self._payload_ranges.native_handler(True))
+            return handler
+
+        return decorator
+
     def default_payload_handler(self, handler):
         """
         Decorator for the default handler, with auto-unpacking based on type hints.
         """
-        wrapper = _create_unpacking_handler(handler, receives_hdl_from_native=True)
-        self._server.set_default_payload_handler(wrapper)
+        self._payload_ranges.set_fallback(_create_unpacking_handler(handler, receives_hdl_from_native=True))
+        self._server.set_default_payload_handler(self._payload_ranges.native_handler(True))
         return handler
 
     def on_request(self, opcode):
@@ -464,7 +642,8 @@ class Server:
 
         The decorated function will be called with ConnectionHdl (for the server)
         and arguments unpacked from the payload reader based on type hints.
-        The handler must return a Payload object as a response.
+        The handler must return a Payload object as a response. As with
+        :meth:`on_payload`, the ``ConnectionHdl`` parameter must come first.
 
         Example:
             @server.on_request(0x1002)
@@ -486,17 +665,22 @@ class Server:
         """Sends a payload to an anonymous session."""
         self._server.send_anonymous(hdl, payload)
 
+    def send_anonymous_many(self, hdl, payloads):
+        """Sends a sequence of payloads to an anonymous session in a single native call."""
+        self._server.send_anonymous_many(hdl, list(payloads))
+
     def on_anon_payload(self, opcode):
         """
         Decorator to register a handler for a specific opcode on anonymous sessions.
 
         The decorated function will be called with arguments unpacked from the
         payload based on type hints. If no type hints are provided, it will be
-        called with `(hdl, payload)`.
+        called with `(hdl, payload)`. Parameters follow the same rules as for
+        :meth:`on_payload`.
 
         Example:
             @server.on_anon_payload(0x5001)
-            def handle_anon_register(hdl, key_data: bytes):
+            def handle_anon_register(hdl: ConnectionHdl, key_data: bytes):
                 print(f"Anonymous client wants to register")
         """
 
@@ -507,13 +691,29 @@ class Server:
 
         return decorator
 
+    def on_anon_payload_range(self, first, last):
+        """
+        Decorator to register a handler for every opcode from ``first`` to ``last``
+        (inclusive) on anonymous sessions that has no handler of its own.
+
+        Arguments are unpacked the same way as for :meth:`on_anon_payload`.
+        """
+
+        def decorator(handler):
+            wrapper = _create_unpacking_handler(handler, receives_hdl_from_native=True)
+            self._anon_payload_ranges.add(first, last, wrapper)
+            self._server.set_anon_default_payload_handler(self._anon_payload_ranges.native_handler(True))
+            return handler
+
+        return decorator
+
     def anon_default_payload_handler(self, handler):
         """
         Decorator for the default handler for anonymous sessions,
         with auto-unpacking based on type hints.
         """
-        wrapper = _create_unpacking_handler(handler, receives_hdl_from_native=True)
-        self._server.set_anon_default_payload_handler(wrapper)
+        self._anon_payload_ranges.set_fallback(_create_unpacking_handler(handler, receives_hdl_from_native=True))
+        self._server.set_anon_default_payload_handler(self._anon_payload_ranges.native_handler(True))
         return handler
 
     def on_anon_request(self, opcode):
@@ -551,11 +751,7 @@ class Server:
             def check_identity(hdl, public_key):
                 return public_key.data == allowed_key.data
         """
-
-        def wrapper(hdl, pk):
-            return handler(hdl, pk)
-
-        self._server.set_client_identity_handler(wrapper)
+        self._server.set_client_identity_handler(handler)
 
     def on_client_identity(self, handler):
         """
@@ -594,13 +790,17 @@ class Client:
             server_public_key: The public key of the server to connect to.
             config: An optional Config object. If None, default config is used.
         """
-        if not isinstance(server_public_key, _bindings.PublicKey):
-            raise TypeError("server_public_key must be a PublicKey object.")
-
-        key_view = _bindings.KeyPair()
-        key_view.public_key = server_public_key
-        cfg = config if config is not None else _bindings.Config.with_defaults()
-        self._client = _bindings.WsClient(key_view, cfg)
+        cfg = config if config is not None else _default_config()
+        try:
+            # Passing the key by keyword selects only the PublicKey constructor,
+            # so pybind11 also rejects a KeyPair here.
+            self._client = _WsClient(server_public_key=server_public_key, config=cfg)
+        except TypeError as e:
+            # Reword pybind11's message only when the key is at fault.
+            if isinstance(server_public_key, PublicKey):
+                raise
+            raise TypeError("server_public_key must be a PublicKey object.") from e
+        self._payload_ranges = _OpcodeRanges()
 
     def set_client_identity(self, keypair):
         """Sets the client's Ed25519 identity keypair for authentication.
@@ -624,7 +824,7 @@ class Client:
 
     def connect(self, uri):
         """Connects to the server at the given WebSocket URI (e.g., "ws://localhost:9002")."""
-        print(f"[PY-CLIENT] Connecting to {uri}...")
+        logger.info("Client connecting to %s...", uri)
         self._client.connect(uri)
 
     def disconnect(self):
@@ -635,6 +835,10 @@ class Client:
         """Sends a payload to the server."""
         self._client.send(payload)
 
+    def send_many(self, payloads):
+        """Sends a sequence of payloads to the server in a single native call."""
+        self._client.send_many(list(payloads))
+
     async def async_request(self, payload) -> Payload:
         """Sends a request to the server and returns a future for the response."""
         return await asyncio.to_thread(self._client.sync_request, payload)
@@ -705,12 +909,33 @@ class Client:
 
         return decorator
 
+    def on_payload_range(self, first, last):
+        """
+        Decorator to register a handler for every opcode from ``first`` to ``last``
+        (inclusive) from the server that has no handler of its own.
+
+        Arguments are unpacked the same way as for :meth:`on_payload`.
+
+        Example:
+            @client.on_payload_range(0x9000, 0x9FFF)
+            def handle_event(payload: Payload):
+                print(f"Event 0x{payload.op_code:04x}")
+        """
+
+        def decorator(handler):
+            wrapper = _create_unpacking_handler(handler, receives_hdl_from_native=False)
+            self._payload_ranges.add(first, last, wrapper)
+            self._client.set_default_payload_handler(self._payload_ranges.native_handler(False))
+            return handler
+
+        return decorator
+
     def default_payload_handler(self, handler):
         """
         Decorator for the default handler, with auto-unpacking based on type hints.
         """
-        wrapper = _create_unpacking_handler(handler, receives_hdl_from_native=False)
-        self._client.set_default_payload_handler(wrapper)
+        self._payload_ranges.set_fallback(_create_unpacking_handler(handler, receives_hdl_from_native=False))
+        self._client.set_default_payload_handler(self._payload_ranges.native_handler(False))
         return handler
 
     def on_request(self, opcode):
@@ -31,6 +31,123 @@ struct WsConnectionHdlWrapper {
 };
 
 
+// Size-dispatching readers shared by PayloadReader.read_* and Payload.unpack.
+static int64_t read_int_param(PayloadReader &self) {
+    size_t size = self.peek_next_param_size();
+    switch (size) {
+        case 1:
+            return self.read_param<int8_t>();
+        case 2:
+            return self.read_param<int16_t>();
+        case 4:
+            return self.read_param<int32_t>();
+        case 8:
+            return self.read_param<int64_t>();
+        default:
+            throw std::runtime_error("Invalid size for a signed integer parameter: " + std::to_string(size));
+    }
+}
+
+static uint64_t read_uint_param(PayloadReader &self) {
+    size_t size = self.peek_next_param_size();
+    switch (size) {
+        case 1:
+            return self.read_param<uint8_t>();
+        case 2:
+            return self.read_param<uint16_t>();
+        case 4:
+            return self.read_param<uint32_t>();
+        case 8:
+            return self.read_param<uint64_t>();
+        default:
+            throw std::runtime_error("Invalid size for an unsigned integer parameter: " + std::to_string(size));
+    }
+}
+
+static double read_float_param(PayloadReader &self) {
+    size_t size = self.peek_next_param_size();
+    switch (size) {
+        case 4:
+            return self.read_param<float>();
+        case 8:
+            return self.read_param<double>();
+        default:
+            throw std::runtime_error("Invalid size for a float/double parameter: " + std::to_string(size));
+    }
+}
+
+// Reads the next parameters described by `fmt` in one call. Format codes:
+// 's' string, 'i' int, 'u' uint, 'f' float, 'b' bool, 'y' bytes.
+static py::tuple read_params(PayloadReader &reader, const std::string &fmt) {
+    py::tuple values(fmt.size());
+    for (size_t i = 0; i < fmt.size(); ++i) {
+        switch (fmt[i]) {
+            case 's':
+                values[i] = py::cast(reader.read_param<std::string>());
+                break;
+            case 'i':
+                values[i] = py::int_(read_int_param(reader));
+                break;
+            case 'u':
+                values[i] = py::int_(read_uint_param(reader));
+                break;
+            case 'f':
+                values[i] = py::float_(read_float_param(reader));
+                break;
+            case 'b':
+                values[i] = py::bool_(reader.read_param<bool>());
+                break;
+            case 'y':
+                values[i] = py::cast(reader.read_param<byte_vector>());
+                break;
+            default:
+                throw py::value_error(std::string("Unknown parameter format code: '") + fmt[i] + "'");
+        }
+    }
+    return values;
+}
+
+// Adds one parameter per argument, choosing the same encoding the matching
+// add_param overload would: bool, the smallest fitting integer (signed
+// first), float, string/bytes, or a sequence of byte values.
+static PayloadBuilder &add_params(PayloadBuilder &self, const py::args &args) {
+    for (const auto &arg : args) {
+        if (py::isinstance<py::bool_>(arg)) {
+            self.add_param(arg.cast<bool>());
+        } else if (py::isinstance<py::int_>(arg)) {
+            int overflow = 0;
+            long long value = PyLong_AsLongLongAndOverflow(arg.ptr(), &overflow);
+            if (overflow > 0) {
+                self.add_param(arg.cast<uint64_t>());
+            } else if (overflow < 0) {
+                throw py::value_error("Integer parameter is out of range for int64_t");
+            } else if (value >= INT8_MIN && value <= INT8_MAX) {
+                self.add_param(static_cast<int8_t>(value));
+            } else if (value >= 0 && value <= UINT8_MAX) {
+                self.add_param(static_cast<uint8_t>(value));
+            } else if (value >= INT16_MIN && value <= INT16_MAX) {
+                self.add_param(static_cast<int16_t>(value));
+            } else if (value >= 0 && value <= UINT16_MAX) {
+                self.add_param(static_cast<uint16_t>(value));
+            } else if (value >= INT32_MIN && value <= INT32_MAX) {
+                self.add_param(static_cast<int32_t>(value));
+            } else if (value >= 0 && value <= UINT32_MAX) {
+                self.add_param(static_cast<uint32_t>(value));
+            } else {
+                self.add_param(static_cast<int64_t>(value));
+            }
+        } else if (py::isinstance<py::float_>(arg)) {
+            self.add_param(arg.cast<float>());
+        } else if (py::isinstance<py::str>(arg) || py::isinstance<py::bytes>(arg)) {
+            self.add_param(arg.cast<std::string>());
+        } else {
+            self.add_param(arg.cast<byte_vector>());
+        }
+    }
+    return self;
+}
+
+
 PYBIND11_MODULE(_obscuraproto, m) {
     m.doc() = "Python bindings for the ObscuraProto C++ library";
 
@@ -144,12 +261,14 @@ PYBIND11_MODULE(_obscuraproto, m) {
         .def_static("init", &Crypto::init)
         .def_static("generate_kx_keypair", &Crypto::generate_kx_keypair)
         .def_static("generate_sign_keypair", &Crypto::generate_sign_keypair)
-        .def_static("sign", &Crypto::sign)
-        .def_static("verify", &Crypto::verify)
-        .def_static("client_compute_session_keys", &Crypto::client_compute_session_keys)
-        .def_static("server_compute_session_keys", &Crypto::server_compute_session_keys)
-        .def_static("encrypt", &Crypto::encrypt)
-        .def_static("decrypt", &Crypto::decrypt);
+        .def_static("sign", &Crypto::sign, py::call_guard<py::gil_scoped_release>())
+        .def_static("verify", &Crypto::verify, py::call_guard<py::gil_scoped_release>())
+        .def_static("client_compute_session_keys", &Crypto::client_compute_session_keys,
+                    py::call_guard<py::gil_scoped_release>())
+        .def_static("server_compute_session_keys", &Crypto::server_compute_session_keys,
+                    py::call_guard<py::gil_scoped_release>())
+        .def_static("encrypt", &Crypto::encrypt, py::call_guard<py::gil_scoped_release>())
+        .def_static("decrypt", &Crypto::decrypt, py::call_guard<py::gil_scoped_release>());
     
     py::class_<Crypto::SessionKeys>(m, "SessionKeys")
         .def(py::init<>())
@@ -161,8 +280,19 @@ PYBIND11_MODULE(_obscuraproto, m) {
         .def(py::init<>(), "Default constructor")
         .def_readwrite("op_code", &Payload::op_code, "The operation code.")
         .def_readwrite("parameters", &Payload::parameters, "The raw parameters data.")
+        // `parameters` stays assignable, so no view into its storage is handed
+        // out; an immutable bytes copy is still one copy instead of a list.
+        .def("parameters_bytes", [](const Payload &self) {
+            return py::bytes(reinterpret_cast<const char*>(self.parameters.data()), self.parameters.size());
+        }, "Returns the raw parameters data as bytes.")
         .def("serialize", &Payload::serialize, "Serializes the payload into a single byte vector.")
-        .def_static("deserialize", &Payload::deserialize, "Deserializes a byte vector into a Payload object.");
+        .def_static("deserialize", &Payload::deserialize, "Deserializes a byte vector into a Payload object.")
+        .def("unpack", [](const Payload &self, const std::string &fmt) {
+            PayloadReader reader(self);
+            return read_params(reader, fmt);
+        }, py::arg("fmt"),
+             "Reads all parameters in one call and returns them as a tuple. "
+             "Format codes: 's' string, 'i' int, 'u' uint, 'f' float, 'b' bool, 'y' bytes.");
 
     py::class_<PayloadBuilder>(m, "PayloadBuilder")
         .def(py::init<Payload::OpCode>(), "Constructor that takes an opcode.")
@@ -180,6 +310,8 @@ PYBIND11_MODULE(_obscuraproto, m) {
         .def("add_param", py::overload_cast<uint64_t>(&PayloadBuilder::add_param))
         .def("add_param", py::overload_cast<float>(&PayloadBuilder::add_param))
         .def("add_param", py::overload_cast<double>(&PayloadBuilder::add_param))
+        .def("add_params", &add_params, py::return_value_policy::reference_internal,
+             "Adds every argument as a parameter in one call, encoded as add_param would.")
         .def("build", &PayloadBuilder::build, "Builds the final Payload object.");
 
     py::class_<PayloadReader>(m, "PayloadReader")
@@ -189,47 +321,12 @@ PYBIND11_MODULE(_obscuraproto, m) {
         .def("read_string", &PayloadReader::read_param<std::string>, "Reads a string parameter.")
         .def("read_bytes", &PayloadReader::read_param<byte_vector>, "Reads a bytes parameter.")
         .def("read_bool", &PayloadReader::read_param<bool>, "Reads a boolean parameter.")
-        .def("read_int", [](PayloadReader &self) -> int64_t {
-            size_t size = self.peek_next_param_size();
-            switch (size) {
-                case 1:
-                    return self.read_param<int8_t>();
-                case 2:
-                    return self.read_param<int16_t>();
-                case 4:
-                    return self.read_param<int32_t>();
-                case 8:
-                    return self.read_param<int64_t>();
-                default:
-                    throw std::runtime_error("Invalid size for a signed integer parameter: " + std::to_string(size));
-            }
-        }, "Reads a signed integer, determining its size from the packet.")
-        .def("read_uint", [](PayloadReader &self) -> uint64_t {
-            size_t size = self.peek_next_param_size();
-            switch (size) {
-                case 1:
-                    return self.read_param<uint8_t>();
-                case 2:
-                    return self.read_param<uint16_t>();
-                case 4:
-                    return self.read_param<uint32_t>();
-                case 8:
-                    return self.read_param<uint64_t>();
-                default:
-                    throw std::runtime_error("Invalid size for an unsigned integer parameter: " + std::to_string(size));
-            }
-        }, "Reads an unsigned integer, determining its size from the packet.")
-        .def("read_float", [](PayloadReader &self) -> double {
-            size_t size = self.peek_next_param_size();
-            switch (size) {
-                case 4:
-                    return self.read_param<float>();
-                case 8:
-                    return self.read_param<double>();
-                default:
-                    throw std::runtime_error("Invalid size for a float/double parameter: " + std::to_string(size));
-            }
-        }, "Reads a float or double, determining its size from the packet and returning it as a double.");
+        .def("read_int", &read_int_param, "Reads a signed integer, determining its size from the packet.")
+        .def("read_uint", &read_uint_param, "Reads an unsigned integer, determining its size from the packet.")
+        .def("read_float", &read_float_param, "Reads a float or double, determining its size from the packet and returning it as a double.")
+        .def("read_params", &read_params, py::arg("spec"),
+             "Reads the next parameters described by a format string and returns them as a tuple. "
+             "Format codes: 's' string, 'i' int, 'u' uint, 'f' float, 'b' bool, 'y' bytes.");
     
     // Stream
     py::class_<Stream, std::shared_ptr<Stream>>(m, "CppStream")
@@ -237,18 +334,25 @@ PYBIND11_MODULE(_obscuraproto, m) {
              "Constructor (stream_id, send_fn) - for testing. Use start_stream() in production.")
         .def("get_stream_id", &Stream::get_stream_id,
              "Returns the stream's unique ID.")
-        .def("write", [](Stream &self, const std::string &data) {
+        .def("write", [](Stream &self, std::string_view data) {
+            // The view points into the caller's buffer, which may be a bytearray
+            // another thread can resize, so copy it into the outgoing vector
+            // while still holding the GIL and release it only for the send.
             byte_vector vec(reinterpret_cast<const uint8_t*>(data.data()),
                             reinterpret_cast<const uint8_t*>(data.data() + data.size()));
+            py::gil_scoped_release release;
             self.write(vec);
-        }, py::call_guard<py::gil_scoped_release>(),
-             "Send a data chunk over the stream.")
+        }, "Send a data chunk over the stream.")
         .def("end", &Stream::end, py::call_guard<py::gil_scoped_release>(),
              "Signal end of outgoing data (half-close).")
         .def("cancel", &Stream::cancel, py::call_guard<py::gil_scoped_release>(),
              "Abort the stream immediately.")
-        .def("set_data_handler", &Stream::set_data_handler,
-             "Register callback for incoming data chunks.")
+        .def("set_data_handler", [](Stream &self, std::function<void(py::bytes)> callback) {
+            self.set_data_handler([callback](const byte_vector &data) {
+                py::gil_scoped_acquire gil;
+                callback(py::bytes(reinterpret_cast<const char*>(data.data()), data.size()));
+            });
+        }, "Register callback for incoming data chunks, which it receives as bytes.")
         .def("set_end_handler", &Stream::set_end_handler,
              "Register callback for remote end-of-stream.")
         .def("set_cancel_handler", &Stream::set_cancel_handler,
@@ -276,7 +380,12 @@ PYBIND11_MODULE(_obscuraproto, m) {
              "Stops the server thread.")
         .def("send", [](WsServerWrapper &self, WsConnectionHdlWrapper hdl, const Payload &payload) {
             self.send(hdl.hdl, payload);
-        }, "Send a payload to a specific client.")
+        }, py::call_guard<py::gil_scoped_release>(), "Send a payload to a specific client.")
+        .def("send_many", [](WsServerWrapper &self, WsConnectionHdlWrapper hdl, const std::vector<Payload> &payloads) {
+            for (const auto &payload : payloads) {
+                self.send(hdl.hdl, payload);
+            }
+        }, py::call_guard<py::gil_scoped_release>(), "Send several payloads to a specific client in one call.")
         .def("sync_request", [](WsServerWrapper &self, WsConnectionHdlWrapper hdl, const Payload &payload) {
             return self.sync_request(hdl.hdl, payload);
         }, py::call_guard<py::gil_scoped_release>(), "Sends a request to a client and returns a response.")
@@ -310,7 +419,12 @@ PYBIND11_MODULE(_obscuraproto, m) {
         // --- Anonymous Sessions ---
         .def("send_anonymous", [](WsServerWrapper &self, WsConnectionHdlWrapper hdl, const Payload &payload) {
             self.send_anonymous(hdl.hdl, payload);
-        }, "Send a payload to an anonymous session.")
+        }, py::call_guard<py::gil_scoped_release>(), "Send a payload to an anonymous session.")
+        .def("send_anonymous_many", [](WsServerWrapper &self, WsConnectionHdlWrapper hdl, const std::vector<Payload> &payloads) {
+            for (const auto &payload : payloads) {
+                self.send_anonymous(hdl.hdl, payload);
+            }
+        }, py::call_guard<py::gil_scoped_release>(), "Send several payloads to an anonymous session in one call.")
         .def("register_anon_op_handler", [](WsServerWrapper &self, Payload::OpCode op_code,
                                             std::function<void(WsConnectionHdlWrapper, Payload)> callback) {
             self.register_anon_op_handler(op_code, [callback](WsConnectionHdl hdl, Payload payload) {
@@ -341,23 +455,35 @@ PYBIND11_MODULE(_obscuraproto, m) {
             return self.get_client_identity(hdl.hdl);
         }, "Gets the verified identity public key for an authenticated session.")
         .def("send_to_identity", &WsServerWrapper::send_to_identity,
+             py::call_guard<py::gil_scoped_release>(),
              "Send a payload to a specific client identified by their public key.")
         .def("sync_request_to_identity", &WsServerWrapper::sync_request_to_identity,
              py::call_guard<py::gil_scoped_release>(),
              "Sends a synchronous request to a specific client identified by their public key.")
         .def("send_response", [](WsServerWrapper &self, WsConnectionHdlWrapper hdl, uint32_t request_id, const Payload &payload) {
             self.send_response(hdl.hdl, request_id, payload);
-        }, "Sends a response to a specific request.");
+        }, py::call_guard<py::gil_scoped_release>(), "Sends a response to a specific request.");
 
     // WS Client
     py::class_<WsClientWrapper>(m, "WsClient")
         .def(py::init<KeyPair, Config>(), py::arg("keypair"), py::arg("config") = Config::with_defaults())
+        .def(py::init([](const PublicKey &server_public_key, Config config) {
+            KeyPair key_view;
+            key_view.publicKey = server_public_key;
+            return new WsClientWrapper(key_view, config);
+        }), py::arg("server_public_key"), py::arg("config") = Config::with_defaults(),
+             "Constructor that takes only the server's public key.")
         .def("connect", &WsClientWrapper::connect, py::call_guard<py::gil_scoped_release>(),
              "Connects to the server and performs handshake.")
         .def("disconnect", &WsClientWrapper::disconnect, py::call_guard<py::gil_scoped_release>(),
              "Disconnects from the server.")
         .def("send", &WsClientWrapper::send, py::call_guard<py::gil_scoped_release>(),
              "Sends a payload to the server.")
+        .def("send_many", [](WsClientWrapper &self, const std::vector<Payload> &payloads) {
+            for (const auto &payload : payloads) {
+                self.send(payload);
+            }
+        }, py::call_guard<py::gil_scoped_release>(), "Sends several payloads to the server in one call.")
         .def("sync_request", [](WsClientWrapper &self, const Payload &payload) {
             return self.sync_request(payload);
         }, py::call_guard<py::gil_scoped_release>(), "Sends a request to the server and returns a response.")
@@ -368,7 +494,7 @@ PYBIND11_MODULE(_obscuraproto, m) {
         .def("register_op_handler", &WsClientWrapper::register_op_handler)
         .def("register_request_handler", &WsClientWrapper::register_request_handler, "Register a request handler for a specific opcode, expecting a Payload response.")
         .def("set_default_payload_handler", &WsClientWrapper::set_default_payload_handler)
-        .def("send_response", &WsClientWrapper::send_response,
+        .def("send_response", &WsClientWrapper::send_response, py::call_guard<py::gil_scoped_release>(),
              "Sends a response to a specific server-initiated request.")
         .def("start_stream", &WsClientWrapper::start_stream, py::call_guard<py::gil_scoped_release>(),
              "Start a new outgoing stream to the server.")
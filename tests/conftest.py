@@ -0,0 +1,28 @@
+import os
+import socket
+import sys
+
+import pytest
+
+# Add the src directory to the path to find the ObscuraProto package
+src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, src_dir)
+
+try:
+    import ObscuraProto as op
+except ImportError as e:
+    pytest.exit(f"Could not import the ObscuraProto package: {e}. Searched in: {sys.path}", returncode=1)
+
+
+@pytest.fixture(scope="session")
+def crypto_init():
+    """Fixture to ensure Crypto is initialized only once per test session."""
+    op.Crypto.init()
+
+
+@pytest.fixture
+def free_port():
+    """Fixture returning a TCP port that was free on localhost when the test started."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
@@ -1,28 +1,14 @@
-import os
-import sys
 import threading
 import time
 
 import pytest
 
-src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
-sys.path.insert(0, src_dir)
-
-try:
-    import ObscuraProto as op
-    from ObscuraProto import _bindings
-except ImportError as e:
-    pytest.fail(f"Could not import ObscuraProto: {e}", pytrace=False)
+import ObscuraProto as op
+from ObscuraProto import _bindings
 
 OP_ANON_REGISTER = 0x6001
 OP_AUTH_GREETING = 0x6002
 OP_ECHO_IDENTITY = 0x6003
-PORT = 9007
-
-
-@pytest.fixture(scope="module")
-def crypto_init():
-    op.Crypto.init()
 
 
 def test_client_hello_serialization_with_identity(crypto_init):
@@ -203,7 +189,7 @@ def test_client_set_identity_high_level(crypto_init):
     assert hasattr(client, "set_client_identity")
 
 
-def test_integration_anonymous_then_authenticated(crypto_init, capsys):
+def test_integration_anonymous_then_authenticated(crypto_init, free_port, capsys):
     """Full integration test: anonymous registration then authenticated session."""
     client_a_ready = threading.Event()
     client_b_ready = threading.Event()
@@ -240,8 +226,7 @@ def test_integration_anonymous_then_authenticated(crypto_init, capsys):
         server.send_to_identity(client_pk, op.PayloadBuilder(OP_AUTH_GREETING).add_param("hello back").build())
 
     try:
-        server.start(PORT)
-        time.sleep(0.2)
+        server.start(free_port)
 
         # --- Client A: Anonymous ---
         print("\n--- Phase 1: Anonymous Client ---")
@@ -258,7 +243,7 @@ def test_integration_anonymous_then_authenticated(crypto_init, capsys):
         def handle_anon_response(payload: op.Payload):
             print("[CLIENT-A] Received anon response")
 
-        client_a.connect(f"ws://localhost:{PORT}")
+        client_a.connect(f"ws://localhost:{free_port}")
         assert client_a_ready.wait(timeout=5), "Client A did not become ready"
 
         client_a.send(op.PayloadBuilder(OP_ANON_REGISTER).add_param("anon data").build())
@@ -285,7 +270,7 @@ def test_integration_anonymous_then_authenticated(crypto_init, capsys):
             print("[CLIENT-B] Received auth greeting")
             client_b_greeting_received.set()
 
-        client_b.connect(f"ws://localhost:{PORT}")
+        client_b.connect(f"ws://localhost:{free_port}")
         assert client_b_ready.wait(timeout=5), "Client B did not become ready"
 
         client_b.send(op.PayloadBuilder(OP_AUTH_GREETING).add_param("hello from authed").build())
@@ -300,7 +285,6 @@ def test_integration_anonymous_then_authenticated(crypto_init, capsys):
         except Exception:
             pass
         server.stop()
-        time.sleep(0.2)
         captured = capsys.readouterr()
         if captured.out:
             print(captured.out)
@@ -1,34 +1,18 @@
-import os
-import sys
+import asyncio
+import functools
 import threading
-import time
 
 import pytest
 
-# Add the src directory to the path to find the ObscuraProto package
-src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
-sys.path.insert(0, src_dir)
-
-try:
-    import ObscuraProto as op
-except ImportError as e:
-    pytest.fail(f"Could not import the ObscuraProto package: {e}. Searched in: {sys.path}", pytrace=False)
+import ObscuraProto as op
 
 # Opcodes for our test
 OP_UNPACK_TEST = 0x9001
 OP_RAW_TEST = 0x9002
 OP_RESPONSE = 0x9003
 
-PORT = 9004
-
-
-@pytest.fixture(scope="module")
-def crypto_init():
-    """Fixture to ensure Crypto is initialized only once per module."""
-    op.Crypto.init()
 
-
-def test_auto_unpacking(crypto_init, capsys):
+def test_auto_unpacking(crypto_init, free_port, capsys):
     """
     Tests the automatic payload unpacking based on handler type hints.
     """
@@ -79,9 +63,8 @@ def test_auto_unpacking(crypto_init, capsys):
 
     # --- Test Execution ---
     try:
-        server.start(PORT)
-        time.sleep(0.1)
-        client.connect(f"ws://localhost:{PORT}")
+        server.start(free_port)
+        client.connect(f"ws://localhost:{free_port}")
 
         assert client_ready.wait(timeout=5), "Client did not become ready"
 
@@ -113,6 +96,132 @@ def test_auto_unpacking(crypto_init, capsys):
         # --- Cleanup ---
         client.disconnect()
         server.stop()
-        time.sleep(0.1)
         captured = capsys.readouterr()
         print(captured.out)
+
+
+def test_unsupported_type_hint_fails_at_registration(crypto_init):
+    """Handlers with unsupported or missing type hints are rejected when decorated."""
+    server = op.Server()
+
+    with pytest.raises(TypeError, match="unsupported or missing type hint"):
+
+        @server.on_anon_payload(OP_UNPACK_TEST)
+        def handle_list(hdl: op.ConnectionHdl, values: list):
+            pass
+
+    with pytest.raises(TypeError, match="unsupported or missing type hint"):
+
+        @server.on_anon_payload(OP_UNPACK_TEST)
+        def handle_untyped(hdl: op.ConnectionHdl, name):
+            pass
+
+
+def test_keyword_only_parameters_fail_at_registration(crypto_init):
+    """Handlers are called positionally, so keyword-only parameters are rejected when decorated."""
+    server = op.Server()
+
+    with pytest.raises(TypeError, match="keyword-only parameter 'name'"):
+
+        @server.on_anon_payload(OP_UNPACK_TEST)
+        def handle_kwonly(hdl: op.ConnectionHdl, *, name: str):
+            pass
+
+    with pytest.raises(TypeError, match="keyword-only parameter 'name'"):
+
+        @server.on_anon_request(OP_UNPACK_TEST)
+        def handle_kwonly_request(hdl: op.ConnectionHdl, *, name: str) -> op.Payload:
+            return op.PayloadBuilder(OP_RESPONSE).build()
+
+    with pytest.raises(TypeError, match="ConnectionHdl parameter first"):
+
+        @server.on_anon_request(OP_UNPACK_TEST)
+        def handle_late_hdl(name: str, hdl: op.ConnectionHdl) -> op.Payload:
+            return op.PayloadBuilder(OP_RESPONSE).build()
+
+
+def _logged(handler):
+    """A typical pass-through decorator that hides the handler signature behind *args/**kwargs."""
+
+    @functools.wraps(handler)
+    def wrapper(*args, **kwargs):
+        return handler(*args, **kwargs)
+
+    return wrapper
+
+
+def test_decorated_handlers_are_unpacked(crypto_init, free_port):
+    """Handlers wrapped with functools.wraps are unpacked using the wrapped signature."""
+    client_ready = threading.Event()
+    payload_received = threading.Event()
+    received = {}
+
+    server = op.Server()
+
+    @server.on_anon_payload(OP_UNPACK_TEST)
+    @_logged
+    def handle_unpack(hdl: op.ConnectionHdl, name: str, value: op.uint):
+        received["payload"] = (name, value)
+        payload_received.set()
+
+    @server.on_anon_request(OP_RAW_TEST)
+    @_logged
+    def handle_request(hdl: op.ConnectionHdl, name: str, value: op.uint) -> op.Payload:
+        return op.PayloadBuilder(OP_RESPONSE).add_params(name, value).build()
+
+    client = op.Client(server.public_key)
+
+    @client.on_ready
+    def on_ready():
+        client_ready.set()
+
+    try:
+        server.start(free_port)
+        client.connect(f"ws://localhost:{free_port}")
+        assert client_ready.wait(timeout=5), "Client did not become ready"
+
+        client.send(op.PayloadBuilder(OP_UNPACK_TEST).add_params("test_name", op.uint(42)).build())
+        assert payload_received.wait(timeout=5), "Decorated payload handler was not called"
+        assert received["payload"] == ("test_name", 42)
+
+        request = op.PayloadBuilder(OP_RAW_TEST).add_params("request_name", op.uint(7)).build()
+        response = asyncio.run(client.async_request(request))
+        assert response.op_code == OP_RESPONSE
+        assert response.unpack("su") == ("request_name", 7)
+
+    finally:
+        client.disconnect()
+        server.stop()
+
+
+def test_malformed_request_gets_error_payload(crypto_init, free_port, caplog):
+    """A request that does not match the handler signature is answered with an error payload and logged."""
+    client_ready = threading.Event()
+
+    server = op.Server()
+
+    @server.on_anon_request(OP_RAW_TEST)
+    def handle_request(hdl: op.ConnectionHdl, name: str, value: op.uint) -> op.Payload:
+        return op.PayloadBuilder(OP_RESPONSE).build()
+
+    client = op.Client(server.public_key)
+
+    @client.on_ready
+    def on_ready():
+        client_ready.set()
+
+    try:
+        server.start(free_port)
+        client.connect(f"ws://localhost:{free_port}")
+        assert client_ready.wait(timeout=5), "Client did not become ready"
+
+        with caplog.at_level("ERROR", logger="ObscuraProto"):
+            response = asyncio.run(client.async_request(op.PayloadBuilder(OP_RAW_TEST).add_param("name").build()))
+
+        assert response.op_code == 0x0000
+        assert response.unpack("s")[0].startswith("Error: ")
+        assert "Failed to auto-unpack request payload for handler 'handle_request'" in caplog.text
+
+    finally:
+        client.disconnect()
+        server.stop()
@@ -1,23 +1,13 @@
-import os
-import sys
-
 import pytest
 
-# Add the src directory to the path to find the ObscuraProto package
-src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
-sys.path.insert(0, src_dir)
-
-try:
-    # We import the raw C++ bindings for testing low-level functionalities
-    from ObscuraProto import _bindings
+# We import the raw C++ bindings for testing low-level functionalities
+from ObscuraProto import _bindings
 
-    PayloadBuilder = _bindings.PayloadBuilder
-    PayloadReader = _bindings.PayloadReader
-    KeyPair = _bindings.KeyPair
-    ConnectionHdl = _bindings.ConnectionHdl  # Need this for Server test
-    Payload = _bindings.Payload  # Need this for mock return values
-except ImportError as e:
-    pytest.fail(f"Could not import the ObscuraProto bindings: {e}. Searched in: {sys.path}", pytrace=False)
+PayloadBuilder = _bindings.PayloadBuilder
+PayloadReader = _bindings.PayloadReader
+KeyPair = _bindings.KeyPair
+ConnectionHdl = _bindings.ConnectionHdl  # Need this for Server test
+Payload = _bindings.Payload  # Need this for mock return values
 
 
 def test_read_int_uint_and_peek():
@@ -102,6 +92,63 @@ def test_type_interchangeability():
     assert reader_u.read_uint() == 255
 
 
+def test_payload_unpack():
+    """Tests reading all parameters of a payload in one Payload.unpack call."""
+    payload = (
+        PayloadBuilder(4)
+        .add_param("name")
+        .add_param(-7)
+        .add_param(70000)
+        .add_param(1.5)
+        .add_param(True)
+        .add_param(b"hi")
+    ).build()
+
+    assert payload.unpack("siufby") == ("name", -7, 70000, 1.5, True, [104, 105])
+    assert payload.unpack("") == ()
+
+    with pytest.raises(ValueError):
+        payload.unpack("x")
+
+
+def test_payload_parameters_bytes():
+    """Tests that parameters_bytes() returns the raw parameters as bytes that outlive reassignment."""
+    payload = PayloadBuilder(6).add_param("hi").add_param(7).build()
+    original = payload.parameters
+
+    data = payload.parameters_bytes()
+    assert isinstance(data, bytes)
+    assert list(data) == original
+
+    view = memoryview(data)
+    payload.parameters = [0] * 4096
+    assert view.tolist() == original
+
+
+def test_builder_add_params_and_reader_read_params():
+    """Tests adding and reading several parameters with one call each."""
+    payload = PayloadBuilder(5).add_params("name", -7, 250, 70000, 1.5, True, b"hi").build()
+
+    # add_params picks the same encodings as chained add_param calls.
+    chained = (
+        PayloadBuilder(5)
+        .add_param("name")
+        .add_param(-7)
+        .add_param(250)
+        .add_param(70000)
+        .add_param(1.5)
+        .add_param(True)
+        .add_param(b"hi")
+        .build()
+    )
+    assert payload.parameters == chained.parameters
+
+    reader = PayloadReader(payload)
+    assert reader.read_params("si") == ("name", -7)
+    assert reader.read_params("uufby") == (250, 70000, 1.5, True, [104, 105])
+    assert not reader.has_more()
+
+
 def test_ws_server_register_request_handler():
     """
     Tests that WsServerWrapper.register_request_handler can accept a Python callable
@@ -151,6 +198,20 @@ def test_ws_client_register_request_handler():
         pytest.fail(f"register_request_handler for WsClient raised an exception: {e}")
 
 
+def test_ws_client_from_public_key():
+    """
+    Tests that WsClient can be constructed directly from the server's public key,
+    with and without an explicit config.
+    """
+    server_keys = _bindings.Crypto.generate_sign_keypair()
+
+    client = _bindings.WsClient(server_keys.public_key)
+    client_with_config = _bindings.WsClient(server_keys.public_key, _bindings.Config.with_defaults())
+
+    assert hasattr(client, "connect")
+    assert hasattr(client_with_config, "connect")
+
+
 def test_stream_low_level():
     """
     Tests the low-level CppStream binding: construction, get_stream_id,
@@ -1,25 +1,8 @@
 import os
-import sys
 import tempfile
 import threading
-import time
 
-import pytest
-
-src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
-sys.path.insert(0, src_dir)
-
-try:
-    import ObscuraProto as op
-except ImportError as e:
-    pytest.fail(f"Could not import ObscuraProto: {e}", pytrace=False)
-
-PORT = 9008
-
-
-@pytest.fixture(scope="module")
-def crypto_init():
-    op.Crypto.init()
+import ObscuraProto as op
 
 
 def test_config_defaults(crypto_init):
@@ -150,7 +133,7 @@ def test_server_with_default_config(crypto_init):
     server.stop()
 
 
-def test_server_with_custom_config(crypto_init, capsys):
+def test_server_with_custom_config(crypto_init, free_port, capsys):
     """Test server with strict rate limits."""
     cfg = op.Config()
     cfg.rate_limit.messages_per_second = 1000
@@ -167,17 +150,15 @@ def test_server_with_custom_config(crypto_init, capsys):
         client_ready.set()
 
     try:
-        server.start(PORT)
-        time.sleep(0.1)
-        client.connect(f"ws://localhost:{PORT}")
+        server.start(free_port)
+        client.connect(f"ws://localhost:{free_port}")
         assert client_ready.wait(timeout=5), "Client did not become ready"
     finally:
         client.disconnect()
         server.stop()
-        time.sleep(0.1)
 
 
-def test_config_with_message_limit(crypto_init, capsys):
+def test_config_with_message_limit(crypto_init, free_port, capsys):
     """Test server with strict message size limit."""
     cfg = op.Config()
     cfg.message_limits.max_decrypted_payload = 100
@@ -186,35 +167,35 @@ def test_config_with_message_limit(crypto_init, capsys):
     client = op.Client(server.public_key, config=cfg)
 
     client_ready = threading.Event()
+    payload_received = threading.Event()
     received_payloads = []
 
     @server.on_anon_payload(0x5001)
     def handle_test(hdl: op.ConnectionHdl, payload: op.Payload):
         received_payloads.append(payload)
+        payload_received.set()
 
     @client.on_ready
     def on_ready():
         client_ready.set()
 
     try:
-        server.start(PORT + 1)
-        time.sleep(0.1)
-        client.connect(f"ws://localhost:{PORT + 1}")
+        server.start(free_port)
+        client.connect(f"ws://localhost:{free_port}")
         assert client_ready.wait(timeout=5), "Client did not become ready"
 
         small_payload = op.PayloadBuilder(0x5001).add_param("small").build()
         client.send(small_payload)
-        time.sleep(0.3)
 
         # The small payload should have been delivered
+        assert payload_received.wait(timeout=5), "Server did not receive the small payload"
         assert len(received_payloads) > 0
     finally:
         client.disconnect()
         server.stop()
-        time.sleep(0.1)
 
 
-def test_config_with_timeouts_disabled(crypto_init, capsys):
+def test_config_with_timeouts_disabled(crypto_init, free_port, capsys):
     """Test server with timeouts disabled."""
     cfg = op.Config()
     cfg.timeouts.enabled = False
@@ -229,17 +210,15 @@ def test_config_with_timeouts_disabled(crypto_init, capsys):
         client_ready.set()
 
     try:
-        server.start(PORT + 2)
-        time.sleep(0.1)
-        client.connect(f"ws://localhost:{PORT + 2}")
+        server.start(free_port)
+        client.connect(f"ws://localhost:{free_port}")
         assert client_ready.wait(timeout=5), "Client did not become ready"
     finally:
         client.disconnect()
         server.stop()
-        time.sleep(0.1)
 
 
-def test_config_all_limits_disabled(crypto_init, capsys):
+def test_config_all_limits_disabled(crypto_init, free_port, capsys):
     """Test server with all rate/message/timeout limits disabled."""
     cfg = op.Config()
     cfg.rate_limit.enabled = False
@@ -262,9 +241,8 @@ def test_config_all_limits_disabled(crypto_init, capsys):
         client_ready.set()
 
     try:
-        server.start(PORT + 3)
-        time.sleep(0.1)
-        client.connect(f"ws://localhost:{PORT + 3}")
+        server.start(free_port)
+        client.connect(f"ws://localhost:{free_port}")
         assert client_ready.wait(timeout=5), "Client did not become ready"
 
         client.send(op.PayloadBuilder(0x6001).add_param("test").build())
@@ -272,4 +250,3 @@ def test_config_all_limits_disabled(crypto_init, capsys):
     finally:
         client.disconnect()
         server.stop()
-        time.sleep(0.1)
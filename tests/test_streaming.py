@@ -2,30 +2,13 @@
 End-to-end tests for the bidirectional streaming API.
 """
 
-import os
-import sys
 import threading
 import time
 
-import pytest
+import ObscuraProto as op
 
-src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
-sys.path.insert(0, src_dir)
 
-try:
-    import ObscuraProto as op
-except ImportError as e:
-    pytest.fail(f"Could not import the ObscuraProto package: {e}. Searched in: {sys.path}", pytrace=False)
-
-PORT = 9005
-
-
-@pytest.fixture(scope="module")
-def crypto_init():
-    op.Crypto.init()
-
-
-def test_bidirectional_streaming(crypto_init, capsys):
+def test_bidirectional_streaming(crypto_init, free_port, capsys):
     """
     Tests a full bidirectional streaming flow:
         1. Server registers an incoming-stream handler (echo server).
@@ -90,9 +73,8 @@ def test_bidirectional_streaming(crypto_init, capsys):
 
     # --- Test body ---
     try:
-        server.start(PORT)
-        time.sleep(0.1)
-        client.connect(f"ws://localhost:{PORT}")
+        server.start(free_port)
+        client.connect(f"ws://localhost:{free_port}")
 
         assert client_ready.wait(timeout=5), "Client did not become ready"
         assert stream_started.wait(timeout=5), "Stream did not start"
@@ -111,6 +93,42 @@ def test_bidirectional_streaming(crypto_init, capsys):
     finally:
         client.disconnect()
         server.stop()
-        time.sleep(0.1)
         captured = capsys.readouterr()
         print(captured.out)
+
+
+def test_stream_data_arrives_as_bytes(crypto_init, free_port):
+    """CppStream.set_data_handler delivers each incoming chunk as bytes."""
+    client_ready = threading.Event()
+    chunk_received = threading.Event()
+    chunks = []
+
+    server = op.Server()
+
+    @server.on_incoming_stream
+    def handle_stream(stream: op.Stream):
+        @stream.on_data
+        def on_data(data: bytes):
+            chunks.append(data)
+            chunk_received.set()
+
+    client = op.Client(server.public_key)
+
+    @client.on_ready
+    def on_ready():
+        client_ready.set()
+
+    try:
+        server.start(free_port)
+        client.connect(f"ws://localhost:{free_port}")
+        assert client_ready.wait(timeout=5), "Client did not become ready"
+
+        client.start_stream().write(b"chunk")
+        assert chunk_received.wait(timeout=5), "Server did not receive the chunk"
+
+        assert type(chunks[0]) is bytes
+        assert chunks[0] == b"chunk"
+
+    finally:
+        client.disconnect()
+        server.stop()
@@ -1,18 +1,9 @@
 import os
-import sys
 import threading
-import time
 
 import pytest
 
-# Add the src directory to the path to find the ObscuraProto package
-src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
-sys.path.insert(0, src_dir)
-
-try:
-    import ObscuraProto as op
-except ImportError as e:
-    pytest.fail(f"Could not import the ObscuraProto package: {e}. Searched in: {sys.path}", pytrace=False)
+import ObscuraProto as op
 
 # Opcodes for our test
 OP_C2S_ECHO = 0x7001
@@ -20,16 +11,17 @@ OP_C2S_UNHANDLED = 0x7002
 OP_S2C_RESPONSE = 0x8001
 OP_S2C_UNHANDLED = 0x8002
 
-PORT = 9003
-
+# Set PYOBSCURA_TEST_DEBUG=1 (and run pytest with -s) to trace handler calls.
+DEBUG = os.environ.get("PYOBSCURA_TEST_DEBUG") == "1"
 
-@pytest.fixture(scope="module")
-def crypto_init():
-    """Fixture to ensure Crypto is initialized only once per module."""
-    op.Crypto.init()
+# Payloads are never mutated by send, so they are built once at import.
+ECHO_PAYLOAD = op.PayloadBuilder(OP_C2S_ECHO).add_param("echo me").build()
+UNHANDLED_PAYLOAD = op.PayloadBuilder(OP_C2S_UNHANDLED).add_param("unhandled").build()
+S2C_UNHANDLED_PAYLOAD = op.PayloadBuilder(OP_S2C_UNHANDLED).build()
+DEFAULT_RESPONSE_PAYLOAD = op.PayloadBuilder(OP_S2C_RESPONSE).add_param("Handled by default").build()
 
 
-def test_websocket_session(crypto_init, capsys):
+def test_websocket_session(crypto_init, free_port):
     """
     Tests the full high-level websocket session, including opcode handlers.
     """
@@ -39,76 +31,84 @@ def test_websocket_session(crypto_init, capsys):
     server_received_payloads = {}
     client_received_payloads = {}
 
-    server_echo_received = threading.Event()
-    server_unhandled_received = threading.Event()
-    client_response_received = threading.Event()
-    client_unhandled_received = threading.Event()
+    # Four handlers must fire: server echo, server default, client response, client default
+    events_cond = threading.Condition()
+    events_remaining = [4]
+
+    def event_done():
+        with events_cond:
+            events_remaining[0] -= 1
+            events_cond.notify()
 
     # --- Server Setup ---
     server = op.Server()
 
     @server.on_anon_payload(OP_C2S_ECHO)
     def handle_echo(hdl: op.ConnectionHdl, payload: op.Payload):
-        print("[SERVER] Echo handler called")
+        if DEBUG:
+            print("[SERVER] Echo handler called")
         server_received_payloads[OP_C2S_ECHO] = payload
         # Echo back and also send another message
-        server.send_anonymous(hdl, payload)
-        server.send_anonymous(hdl, op.PayloadBuilder(OP_S2C_UNHANDLED).build())
-        server_echo_received.set()
+        server.send_anonymous_many(hdl, [payload, S2C_UNHANDLED_PAYLOAD])
+        event_done()
 
     @server.anon_default_payload_handler
     def default_server_handler(hdl: op.ConnectionHdl, payload: op.Payload):
-        print("[SERVER] Default handler called")
+        if DEBUG:
+            print("[SERVER] Default handler called")
         server_received_payloads[payload.op_code] = payload
         # Send a specific response for the unhandled message
-        server.send_anonymous(hdl, op.PayloadBuilder(OP_S2C_RESPONSE).add_param("Handled by default").build())
-        server_unhandled_received.set()
+        server.send_anonymous(hdl, DEFAULT_RESPONSE_PAYLOAD)
+        event_done()
 
     # --- Client Setup ---
     client = op.Client(server.public_key)
 
     @client.on_ready
     def on_ready():
-        print("[CLIENT] Ready handler called")
+        if DEBUG:
+            print("[CLIENT] Ready handler called")
         client_ready.set()
 
     @client.on_payload(OP_C2S_ECHO)  # Expecting the echo back
     def client_echo_handler(payload: op.Payload):
-        print("[CLIENT] Echo handler called")
+        if DEBUG:
+            print("[CLIENT] Echo handler called")
         client_received_payloads[OP_C2S_ECHO] = payload
 
     @client.on_payload(OP_S2C_RESPONSE)
     def client_response_handler(payload: op.Payload):
-        print("[CLIENT] Response handler called")
+        if DEBUG:
+            print("[CLIENT] Response handler called")
         client_received_payloads[OP_S2C_RESPONSE] = payload
-        client_response_received.set()
+        event_done()
 
     @client.default_payload_handler
     def default_client_handler(payload: op.Payload):
-        print("[CLIENT] Default handler called")
+        if DEBUG:
+            print("[CLIENT] Default handler called")
         client_received_payloads[payload.op_code] = payload
-        client_unhandled_received.set()
+        event_done()
 
     # --- Test Execution ---
     try:
-        server.start(PORT)
-        time.sleep(0.1)  # Give server time to start
-        client.connect(f"ws://localhost:{PORT}")
+        server.start(free_port)
+        client.connect(f"ws://localhost:{free_port}")
 
         # 1. Wait for client to be ready
         assert client_ready.wait(timeout=5), "Client did not become ready"
 
         # 2. Send messages from client
-        print("\n[TEST] Client sending messages...")
-        client.send(op.PayloadBuilder(OP_C2S_ECHO).add_param("echo me").build())
-        client.send(op.PayloadBuilder(OP_C2S_UNHANDLED).add_param("unhandled").build())
+        if DEBUG:
+            print("\n[TEST] Client sending messages...")
+        client.send_many([ECHO_PAYLOAD, UNHANDLED_PAYLOAD])
 
         # 3. Wait for all events to be processed
-        print("[TEST] Waiting for events...")
-        assert server_echo_received.wait(timeout=5), "Server did not receive echo payload"
-        assert server_unhandled_received.wait(timeout=5), "Server did not receive unhandled payload"
-        assert client_response_received.wait(timeout=5), "Client did not receive response payload"
-        assert client_unhandled_received.wait(timeout=5), "Client did not receive unhandled payload"
+        if DEBUG:
+            print("[TEST] Waiting for events...")
+        with events_cond:
+            all_done = events_cond.wait_for(lambda: events_remaining[0] == 0, timeout=5)
+        assert all_done, f"{events_remaining[0]} of 4 handlers did not run"
 
         # 4. Assertions
         # Server should have received two payloads
@@ -131,12 +131,81 @@ def test_websocket_session(crypto_init, capsys):
 
     finally:
         # --- Cleanup ---
-        print("\n[TEST] Cleaning up...")
+        if DEBUG:
+            print("\n[TEST] Cleaning up...")
         client.disconnect()
         server.stop()
-        # Allow time for threads to join
-        time.sleep(0.1)
-        captured = capsys.readouterr()
-        print(captured.out)
-        print(captured.err)
-        print("[TEST] Cleanup complete.")
+        if DEBUG:
+            print("[TEST] Cleanup complete.")
+
+
+def test_payload_range_handlers(crypto_init, free_port):
+    """
+    Tests that range handlers receive opcodes inside their range and the
+    default handler still receives everything else.
+    """
+    client_ready = threading.Event()
+    client_done = threading.Event()
+    server_ranged = []
+    server_default = []
+    client_ranged = []
+
+    server = op.Server()
+
+    @server.on_anon_payload_range(0x7100, 0x71FF)
+    def handle_ranged(hdl: op.ConnectionHdl, payload: op.Payload):
+        server_ranged.append(payload.op_code)
+        reply_code = 0x8100 + (payload.op_code & 0xFF)
+        server.send_anonymous(hdl, op.PayloadBuilder(reply_code).add_param("ranged").build())
+
+    @server.anon_default_payload_handler
+    def handle_default(hdl: op.ConnectionHdl, payload: op.Payload):
+        server_default.append(payload.op_code)
+        server.send_anonymous(hdl, op.PayloadBuilder(0x8200).build())
+
+    client = op.Client(server.public_key)
+
+    @client.on_ready
+    def on_ready():
+        client_ready.set()
+
+    @client.on_payload_range(0x8100, 0x81FF)
+    def client_ranged_handler(text: str):
+        client_ranged.append(text)
+
+    @client.default_payload_handler
+    def client_default_handler(payload: op.Payload):
+        client_done.set()
+
+    with pytest.raises(ValueError, match="overlaps"):
+        server.on_anon_payload_range(0x71F0, 0x7200)(handle_ranged)
+
+    try:
+        server.start(free_port)
+        client.connect(f"ws://localhost:{free_port}")
+        assert client_ready.wait(timeout=5), "Client did not become ready"
+
+        client.send(op.PayloadBuilder(0x7100).build())
+        client.send(op.PayloadBuilder(0x71FF).build())
+        client.send(op.PayloadBuilder(0x7200).build())
+
+        # Payloads are handled in order, so the default reply arrives last.
+        assert client_done.wait(timeout=5), "Client did not receive the default reply"
+        assert server_ranged == [0x7100, 0x71FF]
+        assert server_default == [0x7200]
+        assert client_ranged == ["ranged", "ranged"]
+    finally:
+        client.disconnect()
+        server.stop()
+
+
+def test_client_rejects_invalid_arguments(crypto_init):
+    """Only a bad server key is reported as such; other argument errors come from pybind11 unchanged."""
+    server_keys = op.Crypto.generate_sign_keypair()
+
+    with pytest.raises(TypeError, match="server_public_key must be a PublicKey object"):
+        op.Client(server_keys)
+
+    with pytest.raises(TypeError) as excinfo:
+        op.Client(server_keys.public_key, config="x")
+    assert "server_public_key" not in str(excinfo.value)